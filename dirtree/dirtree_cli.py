@@ -7,7 +7,6 @@ Handles argument parsing and orchestrates the tree generation process.
 import sys
 import argparse
 from pathlib import Path
-import traceback
 
 # --- Imports from other modules ---
 try:
@@ -255,6 +254,7 @@ def main():
                 if not config: # Setup was cancelled
                     sys.exit(0)
             except Exception:
+                import traceback # Deferred: only needed on this error path
                 print(f"\n{Colors.RED}An error occurred during interactive setup:{Colors.RESET}")
                 print(traceback.format_exc())
                 sys.exit(1)
@@ -334,6 +334,7 @@ def main():
         except SystemExit:
             sys.exit(1) # Already handled by error handler or user abort
         except Exception:
+            import traceback # Deferred: only needed on this error path
             print(f"\n{Colors.RED}An unexpected error occurred during execution:{Colors.RESET}")
             print(traceback.format_exc())
             sys.exit(1)
@@ -7,7 +7,7 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Optional, List, Set, Dict, Any
+from typing import Optional, List, Set, FrozenSet, Dict, Any
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +123,7 @@ COMMON_FILE_EXCLUDES: List[str] = [
 
 # File extensions generally considered "binary" or not useful for LLM text context.
 # Used if no specific LLM extensions are provided.
-DEFAULT_LLM_EXCLUDED_EXTENSIONS: Set[str] = {
+DEFAULT_LLM_EXCLUDED_EXTENSIONS: FrozenSet[str] = frozenset({
     # Images
     "jpg", "jpeg", "png", "gif", "bmp", "ico", "webp", "tiff", "tif", "psd", "svg",
     # Audio/Video
@@ -140,11 +140,11 @@ DEFAULT_LLM_EXCLUDED_EXTENSIONS: Set[str] = {
     "ttf", "otf", "woff", "woff2", "eot",
     # Other
     "iso", "img", "swf", "dat", "pickle", "pkl", "model", "pt", "onnx", "lock", "bak",
-}
+})
 
 # Default extensions to *include* in LLM exports if no specific list is given
 # (common code and text files). Overrides DEFAULT_LLM_EXCLUDED_EXTENSIONS.
-DEFAULT_LLM_INCLUDE_EXTENSIONS: Set[str] = {
+DEFAULT_LLM_INCLUDE_EXTENSIONS: FrozenSet[str] = frozenset({
     # Programming languages
     "py", "pyw", "js", "jsx", "ts", "tsx", "java", "c", "cpp", "h", "hpp", "cs",
     "go", "rb", "php", "swift", "kt", "kts", "rs", "lua", "pl", "pm", "dart", "fs", "fsx",
@@ -168,7 +168,7 @@ DEFAULT_LLM_INCLUDE_EXTENSIONS: Set[str] = {
     "yaml-tml", "json-tml", "http", "rest", "openapi.yaml", "openapi.json", "asyncapi.yaml",
     "asyncapi.json", "patch", "diff", "srt", "vtt", "sub", "wgsl", "glsl", "hlsl", "metal",
     "rules", "webmanifest", "xml_clean",
-}
+})
 
 
 # Get user's preferred terminal width
@@ -7,7 +7,6 @@ import fnmatch
 
 import sys
 import os
-import traceback
 from pathlib import Path
 from typing import List, Optional, Tuple, Set
 
@@ -240,6 +239,11 @@ class IntuitiveDirTree:
             "dir_last_tee": style.get("dir_last_tee", style["last_tee"]) # Fallback
         }
 
+        # Hoist per-entry invariants out of the formatting loop
+        reset = Colors.RESET if self.colorize else ""
+        get_color = self._get_color
+        emoji_style = self.style_name == "emoji"
+
         for i, entry in enumerate(ordered_entries):
             entry_path = Path(entry.path)
             is_entry_dir = entry.is_dir() # Follow symlinks to determine if it's a dir for recursion/display
@@ -307,9 +311,8 @@ class IntuitiveDirTree:
                 pointer = pointers["last_tee"] if is_last_entry else pointers["tee"]
 
             display_name = entry.name
-            color = self._get_color(entry_path)
-            reset = Colors.RESET if self.colorize else ""
-            emoji = self._get_file_emoji(entry_path) + " " if self.style_name == "emoji" else ""
+            color = get_color(entry_path)
+            emoji = self._get_file_emoji(entry_path) + " " if emoji_style else ""
 
             size_info_str = ""
             if self.show_size and not is_entry_dir:
@@ -396,6 +399,7 @@ class IntuitiveDirTree:
              self._cached_tree_lines = []
              self._cached_listed_paths_in_tree = []
         except Exception:
+             import traceback # Deferred: only needed on this error path
              if self.colorize:
                  print(f"\n{Colors.RED}An unexpected error occurred during tree generation:{Colors.RESET}")
                  print(f"{Colors.RED}{traceback.format_exc()}{Colors.RESET}")
@@ -8,6 +8,10 @@ setup workflow.
 import sys
 import os
 import fnmatch
+import heapq
+import threading
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from collections import Counter
 from typing import Optional, List, Tuple, Dict, Any, Set, Counter as CounterType
@@ -19,17 +23,31 @@ try:
     import pick as pick_lib # Import with an alias
     pick_module = pick_lib
     pick_available = True
-    if sys.platform != 'win32': # Basic curses check
-        import curses
-        curses.setupterm()
 except ImportError:
     print("Warning: 'pick' library not found. Interactive selection features will be disabled.", file=sys.stderr)
     print("         Install it using: pip install pick", file=sys.stderr)
-except Exception as e: # Broad exception for curses issues
-    print(f"Warning: Failed to initialize 'pick' (potential curses issue): {e}", file=sys.stderr)
-    print("         Interactive selection features might be unstable or disabled.", file=sys.stderr)
-    if sys.platform == 'win32':
-        print("         On Windows, ensure 'windows-curses' is installed: pip install windows-curses", file=sys.stderr)
+
+_curses_checked: bool = False
+
+def _ensure_pick_ready() -> None:
+    """
+    Runs the basic curses sanity check for 'pick' lazily, on first use.
+    Probing the terminal at import time reads terminfo files even for runs
+    that never open an interactive screen, so defer it until an interactive
+    function is actually invoked. Disables pick if the check fails.
+    """
+    global _curses_checked, pick_available
+    if _curses_checked or not pick_available:
+        return
+    _curses_checked = True
+    if sys.platform != 'win32': # Basic curses check
+        try:
+            import curses
+            curses.setupterm()
+        except Exception as e: # Broad exception for curses issues
+            pick_available = False
+            print(f"Warning: Failed to initialize 'pick' (potential curses issue): {e}", file=sys.stderr)
+            print("         Interactive selection features might be unstable or disabled.", file=sys.stderr)
 
 # --- Imports from other modules ---
 try:
@@ -65,15 +83,61 @@ except ImportError:
     __version__ = "?.?.?"
 
 
+# --- Prompt helpers ---
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+# Prompt fragments built once at import; the Colors escapes are invariant,
+# so per-call attribute lookups and re-formatting are avoided.
+_YN_DEFAULT_NO = f"[y/{Colors.GREEN}N{Colors.RESET}]: "
+_YN_DEFAULT_YES = f"[{Colors.GREEN}Y{Colors.RESET}/n]: "
+_SET_DEFAULT_PROMPT_TMPL = f"Set '{{p}}' as default for future runs? {_YN_DEFAULT_NO}"
+
+def _yesno(prompt: str, default: bool = False) -> bool:
+    """Asks a yes/no question; empty or unrecognized input returns `default`."""
+    answer = input(prompt).strip().lower()
+    if default:
+        return answer not in _NO
+    return answer in _YES
+
+
 # --- Interactive Directory Selection ---
 def select_directory_interactive(start_dir: Optional[str] = None) -> Optional[str]:
+    _ensure_pick_ready()
     if not pick_available or pick_module is None: # Check pick_module
         print("Interactive directory selection unavailable ('pick' library missing or failed to load).")
         return None
 
-    current_path = Path(start_dir).resolve() if start_dir and Path(start_dir).exists() else Path.cwd()
+    # Normalize the starting point in one pass: resolve(strict=True) both
+    # checks existence and canonicalizes, instead of a separate exists()
+    # stat followed by a second path walk.
+    current_path = Path.cwd()
+    if start_dir:
+        try:
+            current_path = Path(start_dir).resolve(strict=True)
+        except (OSError, RuntimeError): # RuntimeError: symlink loop on Python <= 3.12
+            pass # Fall back to cwd, as before
     visited_paths: List[Path] = []
 
+    @lru_cache(maxsize=16)
+    def _list_dir(path_str: str) -> Tuple[Tuple[Tuple[str, str], ...], int, int]:
+        # Enumerate subdirectories and count files in a single scandir pass.
+        # DirEntry answers is_dir/is_file from the cached d_type for regular
+        # entries and only stats actual symlinks, so symlinked directories
+        # stay visible and navigable without a stat() per entry. Cached (per
+        # browser session) so revisits via 'Back' / parent navigation don't
+        # rescan; errors are not cached.
+        dirs: List[Tuple[str, str]] = []
+        file_count = 0
+        with os.scandir(path_str) as dir_iter:
+            for entry in dir_iter:
+                if entry.is_dir():
+                    dirs.append((f"📂 {entry.name}", entry.path))
+                elif entry.is_file():
+                    file_count += 1
+        dirs.sort(key=lambda x: x[0].lower())
+        return tuple(dirs), len(dirs), file_count
+
     print(f"\n{Colors.CYAN}Directory Browser Instructions:{Colors.RESET}")
     print(f"- Use {Colors.BOLD}arrow keys{Colors.RESET} to navigate, {Colors.BOLD}Enter{Colors.RESET} to select/go into dir.")
     print(f"- Select {Colors.BOLD}'✅ Select Current...'{Colors.RESET} to confirm.")
@@ -81,32 +145,31 @@ def select_directory_interactive(start_dir: Optional[str] = None) -> Optional[st
 
     try:
         while True:
-            options = []
             title_parts = [f"Directory Browser - Current: {Colors.CYAN}{current_path}{Colors.RESET}"]
 
+            nav_options: List[Tuple[str, str]] = []
             # Parent directory option
             if current_path.parent != current_path: # Not at root
-                options.append(("⬆️  .. (Parent Directory)", str(current_path.parent)))
+                nav_options.append(("⬆️  .. (Parent Directory)", str(current_path.parent)))
 
             # Back option if history exists
             if visited_paths:
-                options.append(("⏪ Back (Previous Directory)", "__BACK__"))
+                nav_options.append(("⏪ Back (Previous Directory)", "__BACK__"))
 
+            dirs_in_current: Tuple[Tuple[str, str], ...] = ()
             try:
-                # List directories
-                dirs_in_current = sorted(
-                    [(f"📂 {d.name}", str(d)) for d in current_path.iterdir() if d.is_dir()],
-                    key=lambda x: x[0].lower()
-                )
-                options.extend(dirs_in_current)
-
-                file_count = sum(1 for _ in current_path.iterdir() if _.is_file())
-                title_parts.append(f"({len(dirs_in_current)} dirs, {file_count} files)")
+                dirs_in_current, dir_count, file_count = _list_dir(str(current_path))
+                title_parts.append(f"({dir_count} dirs, {file_count} files)")
             except Exception as e:
                 title_parts.append(f"{Colors.RED}(Error listing: {e}){Colors.RESET}")
 
-            options.append((f"✅ Select Current: '{current_path.name}'", str(current_path)))
-            options.append(("❌ Cancel Selection", "__CANCEL__"))
+            # Single allocation; no intermediate concatenations or appends
+            options = [
+                *nav_options,
+                *dirs_in_current,
+                (f"✅ Select Current: '{current_path.name}'", str(current_path)),
+                ("❌ Cancel Selection", "__CANCEL__"),
+            ]
 
             title = " ".join(title_parts)
 
@@ -148,6 +211,7 @@ def general_interactive_selection(
     common_items_suggestion: Optional[Set[str]] = None, # e.g. common code extensions
     common_suggestion_label: str = "COMMON items"
 ) -> List[str]:
+    _ensure_pick_ready()
     if not pick_available or pick_module is None:
         print(f"Interactive {item_type_label} selection unavailable ('pick' library missing or failed to load).")
         return []
@@ -155,25 +219,26 @@ def general_interactive_selection(
         print(f"No {item_type_label}s found to select.")
         return []
 
-    actual_preselected = set(preselected_items or [])
+    # Intersect in C against the discovered names; preselected entries that
+    # were not discovered can never be displayed or toggled anyway.
+    actual_preselected = frozenset(preselected_items or []) & items_counter.keys()
     sorted_items = sorted(items_counter.items(), key=lambda item: (-item[1], item[0]))
+    sorted_names = [name for name, _ in sorted_items]
 
-    options = []
-    for name, count in sorted_items:
-        # Use checkmark for preselected items to make selection state clearer
-        if name in actual_preselected:
-            prefix = "✓ "
-        else:
-            prefix = "  "
-        options.append((f"{prefix}{name} ({count} occurrences)", name))
-
-    options.insert(0, (f"✅ Select ALL {item_type_label}s", "__ALL__"))
-    options.insert(1, (f"❌ Select NONE ({mode_action_word} nothing)", "__NONE__"))
-
-    if common_items_suggestion:
-        found_common = any(name in common_items_suggestion for name, _ in sorted_items)
-        if found_common:
-            options.insert(2, (f"🔍 Select {common_suggestion_label}", "__COMMON__"))
+    header = [
+        (f"✅ Select ALL {item_type_label}s", "__ALL__"),
+        (f"❌ Select NONE ({mode_action_word} nothing)", "__NONE__"),
+    ]
+    # isdisjoint short-circuits in C against the smaller set
+    if common_items_suggestion and not common_items_suggestion.isdisjoint(items_counter.keys()):
+        header.append((f"🔍 Select {common_suggestion_label}", "__COMMON__"))
+
+    # Checkmark for preselected items to make selection state clearer
+    body = [
+        (f"{'✓ ' if name in actual_preselected else '  '}{name} ({count} occurrences)", name)
+        for name, count in sorted_items
+    ]
+    options = header + body
 
     full_title = f"{prompt_title}\nControls: ↑/↓ Navigate | Space Toggle | Enter Confirm\nTip: 'ALL'/'NONE'/'COMMON' can save time."
 
@@ -193,20 +258,36 @@ def general_interactive_selection(
             print(f"Error: {e}")
         return list(actual_preselected) # Return original preselection on error
 
-    selected_names = []
-    explicitly_selected_values = {item[0][1] for item in selected_options_tuples} # (('text', value), index)
+    # Single pass over the picker result: collect regular names and the
+    # ALL/NONE/COMMON flags together instead of re-walking the selection
+    # once per sentinel check.
+    has_all = has_none = has_common = False
+    regular_names: List[str] = []
+    regular_names_append = regular_names.append
+    for option_tuple, _ in selected_options_tuples: # (('text', value), index)
+        value = option_tuple[1]
+        if value == "__ALL__":
+            has_all = True
+        elif value == "__NONE__":
+            has_none = True
+        elif value == "__COMMON__":
+            has_common = True
+        else:
+            regular_names_append(value)
 
-    if "__ALL__" in explicitly_selected_values:
-        selected_names = [name for name, _ in sorted_items]
-    elif "__NONE__" in explicitly_selected_values:
+    if has_all:
+        selected_names = list(sorted_names)
+    elif has_none:
         selected_names = []
-    elif "__COMMON__" in explicitly_selected_values and common_items_suggestion:
-        selected_names = [name for name, _ in sorted_items if name in common_items_suggestion]
+    elif has_common and common_items_suggestion:
+        selected_names = [name for name in sorted_names if name in common_items_suggestion]
         # Fallback if common results in empty (e.g. no common items found in project)
         if not selected_names and item_type_label == "file type":
-            selected_names = [name for name, _ in sorted_items if name in DEFAULT_LLM_INCLUDE_EXTENSIONS][:10]
+            # islice stops iterating once 10 names pass the filter
+            selected_names = list(islice(
+                (name for name in sorted_names if name in DEFAULT_LLM_INCLUDE_EXTENSIONS), 10))
     else: # Regular selection
-        selected_names = [val for val in explicitly_selected_values if val not in ("__ALL__", "__NONE__", "__COMMON__")]
+        selected_names = regular_names
 
     print(f"{Colors.GREEN}Selected {len(selected_names)} {item_type_label}s to {mode_action_word}:{Colors.RESET} "
           f"{', '.join(selected_names[:10]) if selected_names else 'None'}"
@@ -239,6 +320,7 @@ def run_interactive_setup() -> Dict[str, Any]:
     ])
 
     dir_choice_idx = 0 # Default to current directory
+    _ensure_pick_ready()
     if pick_available and pick_module:
         picker = pick_module.Picker([opt[0] for opt in dir_options], "Choose directory source:", indicator="=>")
         _, dir_choice_idx = picker.start()
@@ -272,7 +354,7 @@ def run_interactive_setup() -> Dict[str, Any]:
 
     print(f"Using directory: {Colors.CYAN}{config['root_dir']}{Colors.RESET}")
     if config['root_dir'] != default_dir_path_str and chosen_dir_action not in [str(current_dir_path), default_dir_path_str]:
-        if input(f"Set '{config['root_dir']}' as default for future runs? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y':
+        if _yesno(_SET_DEFAULT_PROMPT_TMPL.format(p=config['root_dir'])):
             set_default_dir(config['root_dir'])
             print("Default directory saved.")
 
@@ -281,11 +363,11 @@ def run_interactive_setup() -> Dict[str, Any]:
     print("Configure what appears in the tree and what content is exported for LLMs.")
 
     # Smart Exclude (affects tree and LLM)
-    config['use_smart_exclude'] = input(f"Use Smart Exclude (hides common clutter like .git, node_modules)? [{Colors.GREEN}Y{Colors.RESET}/n]: ").lower() not in ['n', 'no']
+    config['use_smart_exclude'] = _yesno(f"Use Smart Exclude (hides common clutter like .git, node_modules)? {_YN_DEFAULT_YES}", default=True)
     print(f"  Smart Exclude for tree display and LLM export: {'ON' if config['use_smart_exclude'] else 'OFF'}")
 
     # Show Hidden (affects tree display)
-    config['show_hidden'] = input(f"Show hidden files/dirs (starting with '.') in tree? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y'
+    config['show_hidden'] = _yesno(f"Show hidden files/dirs (starting with '.') in tree? {_YN_DEFAULT_NO}")
     print(f"  Show Hidden in tree: {'Yes' if config['show_hidden'] else 'No'}")
 
     # Initialize filter lists
@@ -296,16 +378,33 @@ def run_interactive_setup() -> Dict[str, Any]:
 
     # Interactive Filtering for LLM Content
     print(f"\n{Colors.BOLD}Interactive Filtering for LLM Content:{Colors.RESET}")
-    if input(f"Scan directory to select file types/directories for LLM export? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y':
+    if _yesno(f"Scan directory to select file types/directories for LLM export? {_YN_DEFAULT_NO}"):
         scan_max = 20000
 
         def verbose_log_scan(msg, lvl="debug"):
             log_message(msg, level=lvl, verbose=True, colorize=True)
 
+        def scan_while_user_reads(scan_type: str) -> CounterType[str]:
+            # Run the scan in a background thread so it overlaps the
+            # "Press Enter" pause; a typical human response time absorbs
+            # most of the scan latency on large trees. quiet=True keeps the
+            # scanner's spinner and per-item logs off the prompt line.
+            scan_results: List[CounterType[str]] = []
+            scan_thread = threading.Thread(
+                target=lambda: scan_results.append(scan_directory(
+                    config['root_dir'], scan_type, scan_max,
+                    config['show_hidden'], verbose_log_scan, initial_scan_excludes,
+                    quiet=True)),
+                daemon=True
+            )
+            scan_thread.start()
+            input("Press Enter to continue to the selection screen...")
+            scan_thread.join()
+            return scan_results[0] if scan_results else Counter()
+
         # Scan for file types (for LLM content inclusion)
         print("\n--- Scanning for File Types (for LLM Content Inclusion) ---")
-        input("Press Enter to start scan...")
-        file_types_counts = scan_directory(Path(config['root_dir']), "file", scan_max, config['show_hidden'], verbose_log_scan, initial_scan_excludes)
+        file_types_counts = scan_while_user_reads("file")
         if file_types_counts:
             config['interactive_file_type_includes_for_llm'] = general_interactive_selection(
                 file_types_counts, "file type", "Select File Types to INCLUDE in LLM Export Content:", "INCLUDE",
@@ -316,8 +415,7 @@ def run_interactive_setup() -> Dict[str, Any]:
 
         # Scan for directory names (for LLM content exclusion)
         print("\n--- Scanning for Directory Names (for LLM Content Exclusion) ---")
-        input("Press Enter to start scan...")
-        dir_names_counts = scan_directory(Path(config['root_dir']), "dir", scan_max, config['show_hidden'], verbose_log_scan, initial_scan_excludes)
+        dir_names_counts = scan_while_user_reads("dir")
         if dir_names_counts:
             # We no longer pre-select items as it's confusing, but we still show which ones are always excluded
             # The user's selections will be added to the automatic exclusions
@@ -336,13 +434,13 @@ def run_interactive_setup() -> Dict[str, Any]:
 
     # Step 3: Display Style (Tree)
     print(f"\n{Colors.BOLD}Step 3: Tree Display Style{Colors.RESET}")
-    styles = TreeStyle.AVAILABLE.keys()
+    styles = list(TreeStyle.AVAILABLE) # Validation itself hashes against the dict
     style_options_display = [f"{idx+1}) {s.capitalize()}" for idx, s in enumerate(styles)]
     print("Available styles: " + ", ".join(style_options_display))
     choice = input(f"Choose style number or name [{Colors.GREEN}unicode{Colors.RESET}]: ").strip().lower()
     if choice.isdigit() and 0 < int(choice) <= len(styles):
-        config['style'] = list(styles)[int(choice)-1]
-    elif choice in styles:
+        config['style'] = styles[int(choice)-1]
+    elif choice in TreeStyle.AVAILABLE:
         config['style'] = choice
     else:
         config['style'] = 'unicode'
@@ -353,12 +451,12 @@ def run_interactive_setup() -> Dict[str, Any]:
     config['max_depth'] = int(max_depth_str) if max_depth_str.isdigit() else None
 
     # Show Size in Tree
-    config['show_size'] = input(f"Show file sizes in tree? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y'
-    config['colorize'] = input(f"Use colors in tree output? [{Colors.GREEN}Y{Colors.RESET}/n]: ").lower() not in ['n', 'no']
+    config['show_size'] = _yesno(f"Show file sizes in tree? {_YN_DEFAULT_NO}")
+    config['colorize'] = _yesno(f"Use colors in tree output? {_YN_DEFAULT_YES}", default=True)
 
     # Step 4: LLM Export Specifics
     print(f"\n{Colors.BOLD}Step 4: LLM Export Configuration{Colors.RESET}")
-    config['export_for_llm'] = input(f"Generate LLM export file? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y'
+    config['export_for_llm'] = _yesno(f"Generate LLM export file? {_YN_DEFAULT_NO}")
     if config['export_for_llm']:
         print(f"\n{Colors.MAGENTA}---Content Size Limit for LLM Export---{Colors.RESET}")
         print("Maximum size per file for LLM content (files larger will be truncated or excluded).")
@@ -399,19 +497,20 @@ def run_interactive_setup() -> Dict[str, Any]:
                             except OSError:
                                 pass # Skip files we can't stat
 
-            candidate_files_for_size_check.sort(key=lambda x: x[1], reverse=True)
             if candidate_files_for_size_check:
                 print("Largest potentially includable files (for LLM context):")
                 max_to_show = 5
-                for i, (f_path, f_size) in enumerate(candidate_files_for_size_check[:max_to_show]):
+                # nlargest avoids fully sorting all candidates just to show a few
+                largest_files = heapq.nlargest(max_to_show, candidate_files_for_size_check, key=lambda x: x[1])
+                for i, (f_path, f_size) in enumerate(largest_files):
                     rel_path_str = str(f_path.relative_to(config['root_dir']))
                     print(f"  {i+1}) {Colors.YELLOW}{rel_path_str}{Colors.RESET}: {format_bytes(f_size)}")
                 if len(candidate_files_for_size_check) > max_to_show:
                     print(f"  ... and {len(candidate_files_for_size_check) - max_to_show} more.")
 
                 # Recommend a limit based on the largest few files
-                if candidate_files_for_size_check[0][1] > 50 * 1024: # If largest is > 50KB
-                    rec_limit = min(candidate_files_for_size_check[0][1] + (10*1024), 500 * 1024) # Add buffer, max 500KB
+                if largest_files[0][1] > 50 * 1024: # If largest is > 50KB
+                    rec_limit = min(largest_files[0][1] + (10*1024), 500 * 1024) # Add buffer, max 500KB
                     print(f"Recommended LLM file size limit based on these: {Colors.CYAN}{format_bytes(rec_limit)}{Colors.RESET}")
             else:
                 print("No text-like files found or accessible for size analysis.")
@@ -430,7 +529,7 @@ def run_interactive_setup() -> Dict[str, Any]:
         config['llm_content_extensions'] = None # CLI arg, not set here
 
         config['output_dir'] = input("Directory to save LLM export (empty for current dir): ").strip() or None
-        config['add_file_marker'] = input(f"Add exclusion marker to LLM export file? [{Colors.GREEN}Y{Colors.RESET}/n]: ").lower() not in ['n', 'no']
+        config['add_file_marker'] = _yesno(f"Add exclusion marker to LLM export file? {_YN_DEFAULT_YES}", default=True)
 
         print("LLM inclusion indicators in tree:")
         print("  (1) Show only included [LLM✓] (Default)")
@@ -442,8 +541,8 @@ def run_interactive_setup() -> Dict[str, Any]:
 
     # Step 5: Behavior
     print(f"\n{Colors.BOLD}Step 5: Behavior Options{Colors.RESET}")
-    config['verbose'] = input(f"Show verbose logs? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y'
-    config['skip_errors'] = input(f"Auto-skip filesystem errors? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower() == 'y'
+    config['verbose'] = _yesno(f"Show verbose logs? {_YN_DEFAULT_NO}")
+    config['skip_errors'] = _yesno(f"Auto-skip filesystem errors? {_YN_DEFAULT_NO}")
     config['interactive_prompts'] = not config['skip_errors']
 
     # Summary
@@ -478,8 +577,7 @@ def run_interactive_setup() -> Dict[str, Any]:
         print("Setup cancelled.")
         return {}
 
-    save_config_choice = input(f"Save these settings (excluding directory) for future defaults? [y/{Colors.GREEN}N{Colors.RESET}]: ").lower()
-    if save_config_choice == 'y':
+    if _yesno(f"Save these settings (excluding directory) for future defaults? {_YN_DEFAULT_NO}"):
         save_config(config) # save_config should filter what it saves
         print("Configuration saved.")
 
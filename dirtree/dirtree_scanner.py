@@ -9,7 +9,7 @@ import time
 import os
 from pathlib import Path
 from collections import Counter
-from typing import List, Set, Counter as CounterType, Callable, Optional
+from typing import List, Set, Counter as CounterType, Callable, Optional, Union
 
 # Import Colors for potential warnings within the scanner itself
 try:
@@ -24,25 +24,36 @@ except ImportError:
         COMMON_DIR_EXCLUDES = []
 
 def scan_directory(
-    root_dir: Path,
+    root_dir: Union[str, Path],
     scan_type: str, # "file" or "dir"
     max_items: int,
     show_hidden: bool,
     log_func: Callable, # Function for logging messages
     # For scanning, we primarily care about not recursing into very large common junk folders.
     # Other exclude patterns are less relevant for simple discovery.
-    initial_scan_recursion_excludes: Optional[List[str]] = None
+    initial_scan_recursion_excludes: Optional[List[str]] = None,
+    quiet: bool = False # Suppress spinner and info/debug logs (for backgrounded scans)
 ) -> CounterType[str]:
     """
     Scans directory to find file extensions or directory names for interactive selection lists.
     Uses minimal filtering (show_hidden and recursion excludes) for broad discovery.
+    Accepts a string or Path root so callers need not wrap paths themselves.
+    With quiet=True the progress spinner is disabled and only warnings/errors
+    are logged, so a scan running on a background thread does not paint over
+    whatever the caller is showing on the terminal.
     """
+    root_dir = Path(root_dir)
+    if quiet:
+        caller_log_func = log_func
+        def log_func(msg, lvl="debug"):
+            if lvl in ("warning", "error"):
+                caller_log_func(msg, lvl)
     log_func(f"Starting {scan_type} scan in '{root_dir}' (max: {max_items}, hidden: {show_hidden})", "info")
     item_counter: CounterType[str] = Counter()
     scanned_count = 0
     scan_label = "file types" if scan_type == "file" else "directory names"
 
-    spinner_chars = ["/", "-", "\\", "|"] if sys.stdout.isatty() else [""]
+    spinner_chars = ["/", "-", "\\", "|"] if sys.stdout.isatty() and not quiet else [""]
     spinner_idx = 0
     # Get terminal width for potential future use
     # term_width = shutil.get_terminal_size((80, 20)).columns
@@ -4,7 +4,6 @@ Utility functions for IntuitiveDirTree, including formatting, logging, and error
 """
 
 import sys
-import traceback
 import textwrap
 from pathlib import Path
 from datetime import datetime
@@ -169,6 +168,7 @@ def handle_error(
             return False, False # Don't skip (caller should abort), don't change skip_all
         elif choice == '4' or choice == 'd':
             print(f"\n{color_yellow}--- Error Details (Traceback) ---{color_reset}")
+            import traceback # Deferred: only needed when details are requested
             traceback.print_exc(file=sys.stderr)
             print(f"{color_yellow}---------------------------------{color_reset}\n")
             # Loop again for new action choice